@@ -1,18 +1,74 @@
+import gzip
+import hashlib
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-from flask import Flask, Response, abort, send_file
+from flask import Flask, Response, abort, request, send_file
 
-from generate_calendar import DEFAULT_OUTPUT_FILE
+from generate_calendar import (
+    DEFAULT_OUTPUT_FILE,
+    calculate_default_end_year,
+    generate_calendar,
+    write_if_changed,
+)
 
 app = Flask(__name__)
-OUTPUT_FILE = Path(DEFAULT_OUTPUT_FILE)
+OUTPUT_FILE = Path(DEFAULT_OUTPUT_FILE).resolve()
+COMPRESSED_OUTPUT_FILE = OUTPUT_FILE.with_name(f"{OUTPUT_FILE.name}.gz")
+CALENDAR_MAX_AGE = 3600
+
+
+def build_calendar_file() -> None:
+    start_year = datetime.now().year
+    generate_calendar(start_year, calculate_default_end_year(start_year), output_file=OUTPUT_FILE)
+    write_if_changed(COMPRESSED_OUTPUT_FILE, [gzip.compress(OUTPUT_FILE.read_bytes(), mtime=0)])
+
+
+@lru_cache(maxsize=4)
+def calendar_etag(calendar_file: Path, mtime_ns: int) -> str:
+    return hashlib.sha1(calendar_file.read_bytes(), usedforsecurity=False).hexdigest()
+
+
+def compressed_calendar_is_current(calendar_mtime_ns: int) -> bool:
+    try:
+        return COMPRESSED_OUTPUT_FILE.stat().st_mtime_ns >= calendar_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+@app.cli.command("build-calendar")
+def build_calendar_command() -> None:
+    """Generate the served calendar file; rerun after holiday edits and each new year."""
+    build_calendar_file()
 
 
 @app.get("/")  # type: ignore[misc]
 def index() -> Response:
-    if not OUTPUT_FILE.exists():
-        abort(404, description="Calendar file not found. Run `generate_calendar` first.")
-    return send_file(OUTPUT_FILE, mimetype="text/calendar")
+    try:
+        calendar_stat = OUTPUT_FILE.stat()
+    except FileNotFoundError:
+        abort(404, description="Calendar file not found. Run `flask build-calendar` first.")
+
+    calendar_file = OUTPUT_FILE
+    use_gzip = request.accept_encodings["gzip"] > 0 and compressed_calendar_is_current(
+        calendar_stat.st_mtime_ns
+    )
+    if use_gzip:
+        calendar_file = COMPRESSED_OUTPUT_FILE
+        calendar_stat = calendar_file.stat()
+
+    response = send_file(
+        calendar_file,
+        mimetype="text/calendar",
+        etag=calendar_etag(calendar_file, calendar_stat.st_mtime_ns),
+        last_modified=calendar_stat.st_mtime,
+        max_age=CALENDAR_MAX_AGE,
+    )
+    if use_gzip:
+        response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
 
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 import logging
 
-from generate_calendar import DEFAULT_YEAR_COUNT, build_calendar
+from generate_calendar import DEFAULT_YEAR_COUNT, render_calendar
 
 ROOT = Path(__file__).resolve().parents[2]
 WRANGLER_PATH = ROOT / "wrangler.toml"
@@ -29,10 +29,10 @@ def main() -> None:
     start_year = now.year
     end_year = start_year + year_count - 1
     logging.getLogger().setLevel(logging.WARNING)
-    calendar_text = build_calendar(start_year, end_year).to_ical().decode("utf-8")
+    calendar_bytes = render_calendar(start_year, end_year)
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    CALENDAR_PATH.write_text(calendar_text, encoding="utf-8")
+    CALENDAR_PATH.write_bytes(calendar_bytes)
     GENERATED_AT_PATH.write_text(generated_at, encoding="utf-8")
     print(f"Built fallback calendar for years {start_year}-{end_year} at {generated_at}")
 
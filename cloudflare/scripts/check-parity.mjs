@@ -29,7 +29,7 @@ const pythonResult = spawnSync(
       "import json",
       "from generate_calendar import build_holiday_entries",
       `entries = build_holiday_entries(${startYear}, ${endYear})`,
-      "print(json.dumps([{'name': entry['name'], 'date': entry['date'].isoformat()} for entry in entries]))",
+      "print(json.dumps([{'name': entry.name, 'date': entry.date.isoformat()} for entry in entries]))",
     ].join("; "),
   ],
   {
@@ -1,4 +1,7 @@
 export const DEFAULT_YEAR_COUNT = 2;
+// Days to shift a holiday by Python weekday: Saturday moves to Friday, Sunday to Monday.
+const OBSERVANCE_OFFSETS = [0, 0, 0, 0, 0, -1, 1];
+const ICS_LINE_OCTETS = 75;
 
 export function getYearCount(rawValue, defaultYearCount = DEFAULT_YEAR_COUNT) {
   const parsed = Number.parseInt(rawValue ?? String(defaultYearCount), 10);
@@ -58,15 +61,16 @@ function getEasterSunday(year) {
 }
 
 function adjustForObservance(date) {
-  if (date.getUTCDay() === 6) {
-    return utcDate(date.getUTCFullYear(), date.getUTCMonth() + 1, date.getUTCDate() - 1);
+  const observanceOffset = OBSERVANCE_OFFSETS[pythonWeekday(date)];
+  if (!observanceOffset) {
+    return date;
   }
 
-  if (date.getUTCDay() === 0) {
-    return utcDate(date.getUTCFullYear(), date.getUTCMonth() + 1, date.getUTCDate() + 1);
-  }
-
-  return date;
+  return utcDate(
+    date.getUTCFullYear(),
+    date.getUTCMonth() + 1,
+    date.getUTCDate() + observanceOffset
+  );
 }
 
 function buildFixedDate(year, month, day) {
@@ -188,7 +192,43 @@ function escapeIcsText(value) {
     .replaceAll("\\", "\\\\")
     .replaceAll(";", "\\;")
     .replaceAll(",", "\\,")
-    .replaceAll("\n", "\\n");
+    .replaceAll("\r\n", "\\n")
+    .replaceAll("\n", "\\n")
+    .replaceAll("\r", "\\n");
+}
+
+function utf8Length(char) {
+  const codePoint = char.codePointAt(0);
+  if (codePoint < 0x80) {
+    return 1;
+  }
+  if (codePoint < 0x800) {
+    return 2;
+  }
+  return codePoint < 0x10000 ? 3 : 4;
+}
+
+// Mirrors fold_ics_line in Python: segments stay under 75 octets and an escape is never split.
+function foldIcsLine(line) {
+  const chars = Array.from(line);
+  const foldedLines = [];
+  let lineStart = 0;
+  let lineOctets = 0;
+  for (let index = 0; index < chars.length; index += 1) {
+    const charOctets = utf8Length(chars[index]);
+    if (index > lineStart && lineOctets + charOctets >= ICS_LINE_OCTETS) {
+      let foldAt = index;
+      if (index - lineStart > 1 && "\\^".includes(chars[index - 1])) {
+        foldAt -= 1;
+      }
+      foldedLines.push(chars.slice(lineStart, foldAt).join(""));
+      lineOctets = foldAt < index ? utf8Length(chars[foldAt]) : 0;
+      lineStart = foldAt;
+    }
+    lineOctets += charOctets;
+  }
+  foldedLines.push(chars.slice(lineStart).join(""));
+  return foldedLines.join("\r\n ");
 }
 
 export function buildCalendar(entries) {
@@ -197,9 +237,9 @@ export function buildCalendar(entries) {
   for (const entry of entries) {
     const isoDate = formatIsoDate(entry.date);
     lines.push("BEGIN:VEVENT");
-    lines.push(`SUMMARY:${escapeIcsText(entry.name)}`);
+    lines.push(foldIcsLine(`SUMMARY:${escapeIcsText(entry.name)}`));
     lines.push(`DTSTART;VALUE=DATE:${formatDate(entry.date)}`);
-    lines.push(`UID:${isoDate}-${escapeIcsText(entry.name)}@us-holidays-calendar`);
+    lines.push(foldIcsLine(`UID:${isoDate}-${escapeIcsText(entry.name)}@us-holidays-calendar`));
     lines.push("END:VEVENT");
   }
 
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
-import argparse
+import copy
+import filecmp
 import logging
 import os
+import shutil
 import sys
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
 from datetime import date as calendar_date
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
-from typing import Any, TypedDict, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, Required, TypedDict, cast
 
 import click
 import yaml
-from icalendar import Calendar, Event
+
+if TYPE_CHECKING:
+    from icalendar import Calendar
 
 if sys.version_info < (3, 13):
     raise SystemExit("This script requires Python 3.13 or higher.")
@@ -21,16 +28,24 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 DEFAULT_OUTPUT_FILE = Path("us_holidays.ics")
+BUNDLED_HOLIDAYS_FILE = Path(__file__).with_name("holidays.yaml")
 DEFAULT_YEAR_COUNT = 2
-MUTATION_COMMANDS = {"add-holiday", "remove-holiday"}
+CALENDAR_PRODID = "//US Holidays Calendar//github.com/aaronshivers//"
+ICS_LINE_OCTETS = 75
+DATE_CACHE_SIZE = 4096
+# Days to shift a fixed-date holiday by weekday: Saturday moves to Friday, Sunday to Monday.
+OBSERVANCE_OFFSETS = (0, 0, 0, 0, 0, -1, 1)
+HOLIDAY_SECTIONS = ("manual_holidays", "calculated_holidays", "federal_holidays")
 
 
-class HolidayEntry(TypedDict):
+class HolidayEntry(NamedTuple):
     name: str
     date: calendar_date
 
 
-class PendingHolidayEntry(HolidayEntry, total=False):
+class PendingHolidayEntry(TypedDict, total=False):
+    name: Required[str]
+    date: Required[calendar_date]
     enabled: bool
     observed: bool
 
@@ -44,7 +59,25 @@ def _read_yaml(path: Path) -> dict[str, Any]:
         raise SystemExit(f"{path} is malformed") from exc
 
 
+@lru_cache(maxsize=8)
+def _parse_holidays_file(path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    return _read_yaml(path)
+
+
+def _load_holidays_file(path: Path) -> dict[str, Any]:
+    try:
+        file_stat = path.stat()
+    except FileNotFoundError as exc:
+        raise SystemExit(f"{path} not found") from exc
+
+    # Keyed on stat fields so edits invalidate it; copied because CLI commands mutate the config.
+    return copy.deepcopy(_parse_holidays_file(path, file_stat.st_mtime_ns, file_stat.st_size))
+
+
 def _bundled_holidays() -> dict[str, Any]:
+    if BUNDLED_HOLIDAYS_FILE.is_file():
+        return _load_holidays_file(BUNDLED_HOLIDAYS_FILE)
+
     try:
         raw_yaml = (
             resources.files("generate_calendar")
@@ -62,22 +95,25 @@ def _bundled_holidays() -> dict[str, Any]:
 
 def load_holidays(holidays_file: Path | str | None = None) -> dict[str, Any]:
     holiday_config = (
-        _bundled_holidays() if holidays_file is None else _read_yaml(Path(holidays_file))
+        _bundled_holidays() if holidays_file is None else _load_holidays_file(Path(holidays_file))
     )
     validate_holiday_definitions(holiday_config)
+    for section in HOLIDAY_SECTIONS:
+        for holiday in holiday_config[section]:
+            if isinstance(holiday["name"], str):
+                holiday["name"] = sys.intern(holiday["name"])
     return holiday_config
 
 
 def validate_holiday_definitions(holiday_config: dict[str, Any]) -> None:
-    required_sections = ("manual_holidays", "calculated_holidays", "federal_holidays")
-    missing_sections = [section for section in required_sections if section not in holiday_config]
+    missing_sections = [section for section in HOLIDAY_SECTIONS if section not in holiday_config]
     if missing_sections:
         missing = ", ".join(sorted(missing_sections))
         raise ValueError(f"Holiday config is missing required sections: {missing}")
 
     seen_names: set[str] = set()
     duplicate_names: set[str] = set()
-    for section in required_sections:
+    for section in HOLIDAY_SECTIONS:
         for holiday in holiday_config[section]:
             holiday_name = holiday["name"]
             if holiday_name in seen_names:
@@ -90,11 +126,11 @@ def validate_holiday_definitions(holiday_config: dict[str, Any]) -> None:
 
     for holiday in holiday_config["manual_holidays"]:
         try:
-            datetime(2024, holiday["month"], holiday["day"])
+            calendar_date(2024, holiday["month"], holiday["day"])
         except ValueError as exc:
             raise ValueError(f"Manual holiday has an invalid date: {holiday['name']}") from exc
 
-    for section in required_sections:
+    for section in HOLIDAY_SECTIONS:
         for holiday in holiday_config[section]:
             if "enabled" in holiday and not isinstance(holiday["enabled"], bool):
                 raise ValueError(f"Holiday enabled flag must be true or false: {holiday['name']}")
@@ -103,12 +139,11 @@ def validate_holiday_definitions(holiday_config: dict[str, Any]) -> None:
         if holiday.get("observed") and "day" not in holiday:
             raise ValueError(f"Observed federal holiday must use a fixed date: {holiday['name']}")
 
-    allowed_calculated_types = {"easter", "nth_weekday"}
     invalid_types = sorted(
         {
             holiday["type"]
             for holiday in holiday_config["calculated_holidays"]
-            if holiday["type"] not in allowed_calculated_types
+            if holiday["type"] not in CALCULATED_HOLIDAY_RULES
         }
     )
     if invalid_types:
@@ -118,108 +153,143 @@ def validate_holiday_definitions(holiday_config: dict[str, Any]) -> None:
 
 def save_holidays(holiday_config: dict[str, Any], holidays_file: Path) -> None:
     validate_holiday_definitions(holiday_config)
-    holidays_file.write_text(
-        yaml.safe_dump(holiday_config, sort_keys=False, default_flow_style=False),
-        encoding="utf-8",
+    holidays_yaml = yaml.safe_dump(
+        holiday_config, sort_keys=False, default_flow_style=False, allow_unicode=True
     )
+    # Write through symlinks so a linked holidays.yaml stays a link.
+    write_if_changed(holidays_file.resolve(), [holidays_yaml.encode("utf-8")])
 
 
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def get_easter_sunday(year: int) -> calendar_date:
     a = year % 19
-    b = year // 100
-    c = year % 100
-    d = b // 4
-    e = b % 4
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
     f = (b + 8) // 25
     g = (b - f + 1) // 3
     h = (19 * a + b - d - g + 15) % 30
-    i = c // 4
-    k = c % 4
+    i, k = divmod(c, 4)
     offset_l = (32 + 2 * e + 2 * i - h - k) % 7
     m = (a + 11 * h + 22 * offset_l) // 451
-    month = (h + offset_l - 7 * m + 114) // 31
-    day = ((h + offset_l - 7 * m + 114) % 31) + 1
-    return datetime(year, month, day).date()
+    month, day = divmod(h + offset_l - 7 * m + 114, 31)
+    return calendar_date(year, month, day + 1)
+
+
+def _ordinal_weekday(ordinal: int) -> int:
+    # Ordinal 1 (0001-01-01) is a Monday, matching date.weekday() numbering.
+    return (ordinal - 1) % 7
 
 
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def get_nth_weekday(year: int, month: int, weekday: int, nth: int) -> calendar_date:
-    first_day = datetime(year, month, 1).date()
-    first_weekday = first_day + timedelta(days=(weekday - first_day.weekday() + 7) % 7)
-    return first_weekday + timedelta(weeks=nth - 1)
+    first_ordinal = calendar_date(year, month, 1).toordinal()
+    days_to_add = (weekday - _ordinal_weekday(first_ordinal)) % 7 + 7 * (nth - 1)
+    return calendar_date.fromordinal(first_ordinal + days_to_add)
 
 
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def get_last_weekday(year: int, month: int, weekday: int) -> calendar_date:
-    next_month = month % 12 + 1
-    next_year = year if next_month != 1 else year + 1
-    last_day = datetime(next_year, next_month, 1).date() - timedelta(days=1)
-    days_to_subtract = (last_day.weekday() - weekday + 7) % 7
-    return last_day - timedelta(days=days_to_subtract)
+    last_ordinal = calendar_date(year + month // 12, month % 12 + 1, 1).toordinal() - 1
+    days_to_subtract = (_ordinal_weekday(last_ordinal) - weekday) % 7
+    return calendar_date.fromordinal(last_ordinal - days_to_subtract)
+
+
+def _easter_holiday_date(year: int, holiday: dict[str, Any]) -> calendar_date:
+    return get_easter_sunday(year)
+
+
+def _nth_weekday_holiday_date(year: int, holiday: dict[str, Any]) -> calendar_date:
+    return get_nth_weekday(year, holiday["month"], holiday["weekday"], holiday["nth"])
+
+
+CALCULATED_HOLIDAY_RULES: dict[str, Callable[[int, dict[str, Any]], calendar_date]] = {
+    "easter": _easter_holiday_date,
+    "nth_weekday": _nth_weekday_holiday_date,
+}
 
 
 def adjust_for_observance(holiday_date: calendar_date) -> calendar_date:
-    if holiday_date.weekday() == 5:
-        return holiday_date - timedelta(days=1)
-    if holiday_date.weekday() == 6:
-        return holiday_date + timedelta(days=1)
-    return holiday_date
+    observance_offset = OBSERVANCE_OFFSETS[holiday_date.weekday()]
+    if not observance_offset:
+        return holiday_date
+    return calendar_date.fromordinal(holiday_date.toordinal() + observance_offset)
 
 
-def get_federal_holidays(
+def _federal_holiday_dates(
     year: int, federal_holidays: list[dict[str, Any]]
-) -> list[PendingHolidayEntry]:
-    holidays: list[PendingHolidayEntry] = []
+) -> list[tuple[str, calendar_date, bool]]:
+    holidays: list[tuple[str, calendar_date, bool]] = []
     for holiday in federal_holidays:
         if not holiday.get("enabled", True):
             continue
 
         if "day" in holiday:
-            holiday_date = datetime(year, holiday["month"], holiday["day"]).date()
+            holiday_date = calendar_date(year, holiday["month"], holiday["day"])
         elif "last" in holiday:
             holiday_date = get_last_weekday(year, holiday["month"], holiday["weekday"])
         else:
             holiday_date = get_nth_weekday(
                 year, holiday["month"], holiday["weekday"], holiday["nth"]
             )
-        holidays.append(
-            {
-                "name": holiday["name"],
-                "date": holiday_date,
-                "observed": bool(holiday.get("observed", False)),
-            }
-        )
+        holidays.append((holiday["name"], holiday_date, bool(holiday.get("observed", False))))
     return holidays
 
 
+def get_federal_holidays(
+    year: int, federal_holidays: list[dict[str, Any]]
+) -> list[PendingHolidayEntry]:
+    return [
+        {"name": name, "date": holiday_date, "observed": observed}
+        for name, holiday_date, observed in _federal_holiday_dates(year, federal_holidays)
+    ]
+
+
 def calculate_default_end_year(start_year: int) -> int:
     return start_year + DEFAULT_YEAR_COUNT - 1
 
 
 def build_fixed_date(year: int, month: int, day: int) -> calendar_date | None:
     try:
-        return datetime(year, month, day).date()
+        return calendar_date(year, month, day)
     except ValueError:
         return None
 
 
-def build_holiday_entries(
+def _enabled_holidays(holidays: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [holiday for holiday in holidays if holiday.get("enabled", True)]
+
+
+def iter_holiday_entries(
     start_year: int, end_year: int, holidays_file: Path | str | None = None
-) -> list[HolidayEntry]:
+) -> Iterator[HolidayEntry]:
     if end_year < start_year:
         raise ValueError("end_year must be greater than or equal to start_year")
 
     holiday_config = load_holidays(holidays_file)
-    holidays: list[HolidayEntry] = []
     seen: set[tuple[str, calendar_date]] = set()
     range_start = calendar_date(start_year, 1, 1)
     range_end = calendar_date(end_year, 12, 31)
+    enabled_federal_holidays = _enabled_holidays(holiday_config["federal_holidays"])
+    enabled_manual_holidays = _enabled_holidays(holiday_config["manual_holidays"])
+    enabled_calculated_holidays = _enabled_holidays(holiday_config["calculated_holidays"])
+    observed_federal_holidays = [
+        holiday for holiday in enabled_federal_holidays if holiday.get("observed")
+    ]
 
     for year in range(start_year - 1, end_year + 2):
-        year_holidays = get_federal_holidays(year, holiday_config["federal_holidays"])
+        if start_year <= year <= end_year:
+            federal_holidays = enabled_federal_holidays
+            manual_holidays = enabled_manual_holidays
+            calculated_holidays = enabled_calculated_holidays
+        else:
+            # Neighbouring years only contribute weekend observances that cross into the range.
+            federal_holidays = observed_federal_holidays
+            manual_holidays = []
+            calculated_holidays = []
 
-        for holiday in holiday_config["manual_holidays"]:
-            if not holiday.get("enabled", True):
-                continue
+        year_holidays = _federal_holiday_dates(year, federal_holidays)
 
+        for holiday in manual_holidays:
             holiday_date = build_fixed_date(year, holiday["month"], holiday["day"])
             if holiday_date is None:
                 logger.debug(
@@ -231,25 +301,15 @@ def build_holiday_entries(
                 )
                 continue
 
-            year_holidays.append({"name": holiday["name"], "date": holiday_date, "observed": False})
+            year_holidays.append((holiday["name"], holiday_date, False))
 
-        for holiday in holiday_config["calculated_holidays"]:
-            if not holiday.get("enabled", True):
-                continue
+        for holiday in calculated_holidays:
+            holiday_date = CALCULATED_HOLIDAY_RULES[holiday["type"]](year, holiday)
+            year_holidays.append((holiday["name"], holiday_date, False))
 
-            if holiday["type"] == "easter":
-                holiday_date = get_easter_sunday(year)
-            else:
-                holiday_date = get_nth_weekday(
-                    year, holiday["month"], holiday["weekday"], holiday["nth"]
-                )
-            year_holidays.append({"name": holiday["name"], "date": holiday_date, "observed": False})
-
-        for holiday in year_holidays:
-            holiday_name = cast(str, holiday["name"])
-            holiday_date = cast(calendar_date, holiday["date"])
+        for holiday_name, holiday_date, observed in year_holidays:
             entries = [(holiday_name, holiday_date)]
-            if holiday.get("observed", False):
+            if observed:
                 observed_date = adjust_for_observance(holiday_date)
                 if observed_date != holiday_date:
                     entries.append((f"{holiday_name} (Observed)", observed_date))
@@ -266,26 +326,112 @@ def build_holiday_entries(
                     continue
 
                 seen.add(holiday_key)
-                holidays.append({"name": entry_name, "date": entry_date})
+                yield HolidayEntry(entry_name, entry_date)
 
-    return holidays
+
+def build_holiday_entries(
+    start_year: int, end_year: int, holidays_file: Path | str | None = None
+) -> list[HolidayEntry]:
+    return list(iter_holiday_entries(start_year, end_year, holidays_file=holidays_file))
+
+
+def write_if_changed(path: Path, chunks: Iterable[bytes]) -> bool:
+    temp_file = tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False)
+    temp_path = Path(temp_file.name)
+    try:
+        with temp_file:
+            temp_file.writelines(chunks)
+        try:
+            if filecmp.cmp(temp_path, path, shallow=False):
+                return False
+            shutil.copymode(path, temp_path)
+        except FileNotFoundError as exc:
+            if exc.filename != os.fspath(path):
+                raise
+            # NamedTemporaryFile is private (0600); give new files the umask's usual mode.
+            umask = os.umask(0)
+            os.umask(umask)
+            temp_path.chmod(0o666 & ~umask)
+        os.replace(temp_path, path)
+        return True
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def escape_ics_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+        .replace("\r", "\\n")
+    )
+
+
+def fold_ics_line(line: str) -> str:
+    # Segments stay under 75 octets, and a backslash escape is never split across a fold.
+    folded_lines: list[str] = []
+    line_start = 0
+    line_octets = 0
+    for index, char in enumerate(line):
+        char_octets = len(char.encode("utf-8"))
+        if index > line_start and line_octets + char_octets >= ICS_LINE_OCTETS:
+            fold_at = index
+            if index - line_start > 1 and line[index - 1] in "\\^":
+                fold_at -= 1
+            folded_lines.append(line[line_start:fold_at])
+            line_octets = len(line[fold_at:index].encode("utf-8"))
+            line_start = fold_at
+        line_octets += char_octets
+    folded_lines.append(line[line_start:])
+    return "\r\n ".join(folded_lines)
+
+
+def iter_calendar_lines(
+    start_year: int, end_year: int, holidays_file: Path | str | None = None
+) -> Iterator[str]:
+    yield "BEGIN:VCALENDAR\r\n"
+    yield "VERSION:2.0\r\n"
+    yield f"PRODID:{CALENDAR_PRODID}\r\n"
+
+    logger.info("Generating holidays for years %s to %s", start_year, end_year)
+    for holiday in iter_holiday_entries(start_year, end_year, holidays_file=holidays_file):
+        holiday_name = escape_ics_text(holiday.name)
+        iso_date = holiday.date.isoformat()
+        yield "BEGIN:VEVENT\r\n"
+        yield f"{fold_ics_line(f'SUMMARY:{holiday_name}')}\r\n"
+        yield f"DTSTART;VALUE=DATE:{iso_date.replace('-', '')}\r\n"
+        yield f"{fold_ics_line(f'UID:{iso_date}-{holiday_name}@us-holidays-calendar')}\r\n"
+        yield "END:VEVENT\r\n"
+        logger.info("Added: %s on %s", holiday.name, iso_date)
+
+    yield "END:VCALENDAR\r\n"
+
+
+def render_calendar(
+    start_year: int, end_year: int, holidays_file: Path | str | None = None
+) -> bytes:
+    return "".join(iter_calendar_lines(start_year, end_year, holidays_file)).encode("utf-8")
 
 
 def build_calendar(
     start_year: int, end_year: int, holidays_file: Path | str | None = None
 ) -> Calendar:
+    from icalendar import Calendar, Event
+
     cal = Calendar()
-    cal.add("prodid", "//US Holidays Calendar//github.com/aaronshivers//")
+    cal.add("prodid", CALENDAR_PRODID)
     cal.add("version", "2.0")
 
     logger.info("Generating holidays for years %s to %s", start_year, end_year)
-    for holiday in build_holiday_entries(start_year, end_year, holidays_file=holidays_file):
+    for holiday in iter_holiday_entries(start_year, end_year, holidays_file=holidays_file):
         event = Event()
-        event.add("summary", holiday["name"])
-        event.add("dtstart", holiday["date"])
-        event.add("uid", f"{holiday['date'].isoformat()}-{holiday['name']}@us-holidays-calendar")
+        event.add("summary", holiday.name)
+        event.add("dtstart", holiday.date)
+        event.add("uid", f"{holiday.date.isoformat()}-{holiday.name}@us-holidays-calendar")
         cal.add_component(event)
-        logger.info("Added: %s on %s", holiday["name"], holiday["date"].isoformat())
+        logger.info("Added: %s on %s", holiday.name, holiday.date.isoformat())
 
     return cal
 
@@ -301,15 +447,18 @@ def generate_calendar(
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    cal = build_calendar(start_year, end_year, holidays_file=holidays_file)
     if dry_run:
+        render_calendar(start_year, end_year, holidays_file=holidays_file)
         logger.info("Dry run complete, iCal file not written.")
         return None
 
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_bytes(cal.to_ical())
-    logger.info("Calendar saved as '%s'", output_path)
+    calendar_lines = iter_calendar_lines(start_year, end_year, holidays_file=holidays_file)
+    if write_if_changed(output_path, (line.encode("utf-8") for line in calendar_lines)):
+        logger.info("Calendar saved as '%s'", output_path)
+    else:
+        logger.info("Calendar '%s' is already up to date", output_path)
     return output_path
 
 
@@ -317,18 +466,84 @@ def resolve_mutable_holidays_file(holidays_file: Path | None) -> Path:
     if holidays_file is not None:
         return holidays_file
 
-    default_path = Path(__file__).with_name("holidays.yaml")
-    if default_path.exists() and os.access(default_path, os.W_OK):
-        return default_path
+    bundled_file = BUNDLED_HOLIDAYS_FILE.resolve()
+    if os.access(bundled_file, os.W_OK) and os.access(bundled_file.parent, os.W_OK):
+        return BUNDLED_HOLIDAYS_FILE
 
     raise click.ClickException(
         "Holiday updates require --holidays-file when the bundled holidays file is read-only."
     )
 
 
-@click.group()
-def cli() -> None:
-    """CLI for managing holidays in holidays.yaml."""
+def save_holidays_from_cli(holiday_config: dict[str, Any], holidays_file: Path) -> None:
+    try:
+        save_holidays(holiday_config, holidays_file)
+    except OSError as exc:
+        raise click.ClickException(f"Could not write {holidays_file}: {exc}") from exc
+
+
+@click.group(invoke_without_command=True)
+@click.option(
+    "--year", type=int, default=None, help="Start year for the calendar (default: current year)"
+)
+@click.option(
+    "--end-year",
+    type=int,
+    default=None,
+    help=f"End year for the calendar (default: {DEFAULT_YEAR_COUNT} calendar years total)",
+)
+@click.option("--dry-run", is_flag=True, help="Build the calendar without writing a file")
+@click.option("--verbose", is_flag=True, help="Enable verbose logging")
+@click.option(
+    "--output",
+    type=click.Path(path_type=Path, dir_okay=False),
+    default=DEFAULT_OUTPUT_FILE,
+    help=f"Output iCal file path (default: {DEFAULT_OUTPUT_FILE})",
+)
+@click.option(
+    "--holidays-file",
+    type=click.Path(path_type=Path, dir_okay=False),
+    default=None,
+    help="Optional path to an alternate holidays.yaml file",
+)
+@click.pass_context
+def cli(
+    ctx: click.Context,
+    year: int | None,
+    end_year: int | None,
+    dry_run: bool,
+    verbose: bool,
+    output: Path,
+    holidays_file: Path | None,
+) -> None:
+    """Generate a static US holidays iCal file, or manage holidays in holidays.yaml."""
+    if ctx.invoked_subcommand is not None:
+        generation_options = [
+            f"--{name.replace('_', '-')}"
+            for name in ctx.params
+            if ctx.get_parameter_source(name) is not click.core.ParameterSource.DEFAULT
+        ]
+        if generation_options:
+            raise click.UsageError(
+                f"Calendar generation options ({', '.join(generation_options)}) cannot be "
+                f"combined with '{ctx.invoked_subcommand}'."
+            )
+        return
+
+    start_year = year if year is not None else datetime.now().year
+    if end_year is None:
+        end_year = calculate_default_end_year(start_year)
+    elif end_year < start_year:
+        raise click.BadParameter("must be greater than or equal to --year", param_hint="--end-year")
+
+    generate_calendar(
+        start_year=start_year,
+        end_year=end_year,
+        dry_run=dry_run,
+        verbose=verbose,
+        output_file=output,
+        holidays_file=holidays_file,
+    )
 
 
 @cli.command()
@@ -342,16 +557,14 @@ def add_holiday(holidays_file: Path | None, name: str, month: int, day: int) ->
         raise click.ClickException(f"Invalid month: {month}. Must be between 1 and 12.")
 
     try:
-        datetime(2024, month, day)
+        calendar_date(2024, month, day)
     except ValueError as exc:
         raise click.ClickException(f"Invalid date: {month:02d}-{day:02d}. {exc}") from exc
 
     target_file = resolve_mutable_holidays_file(holidays_file)
     holiday_config = load_holidays(target_file)
     existing_names = {
-        holiday["name"]
-        for section in ("manual_holidays", "calculated_holidays", "federal_holidays")
-        for holiday in holiday_config[section]
+        holiday["name"] for section in HOLIDAY_SECTIONS for holiday in holiday_config[section]
     }
     if name in existing_names:
         raise click.ClickException(f"Holiday '{name}' already exists.")
@@ -360,7 +573,7 @@ def add_holiday(holidays_file: Path | None, name: str, month: int, day: int) ->
     holiday_config["manual_holidays"].sort(
         key=lambda holiday: (holiday["month"], holiday["day"], holiday["name"])
     )
-    save_holidays(holiday_config, target_file)
+    save_holidays_from_cli(holiday_config, target_file)
     click.echo(f"Added holiday: {name} on {month:02d}-{day:02d}")
 
 
@@ -373,7 +586,7 @@ def remove_holiday(holidays_file: Path | None, name: str) -> None:
     holiday_config = load_holidays(target_file)
 
     removed = False
-    for section in ("manual_holidays", "calculated_holidays", "federal_holidays"):
+    for section in HOLIDAY_SECTIONS:
         original_count = len(holiday_config[section])
         holiday_config[section] = [
             holiday for holiday in holiday_config[section] if holiday["name"] != name
@@ -383,64 +596,19 @@ def remove_holiday(holidays_file: Path | None, name: str) -> None:
     if not removed:
         raise click.ClickException(f"Holiday '{name}' was not found.")
 
-    save_holidays(holiday_config, target_file)
+    save_holidays_from_cli(holiday_config, target_file)
     click.echo(f"Removed holiday: {name}")
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Generate a static US holidays iCal file.")
-    parser.add_argument(
-        "--year",
-        type=int,
-        default=datetime.now().year,
-        help="Start year for the calendar (default: current year)",
-    )
-    parser.add_argument(
-        "--end-year",
-        type=int,
-        default=None,
-        help=f"End year for the calendar (default: {DEFAULT_YEAR_COUNT} calendar years total)",
-    )
-    parser.add_argument(
-        "--dry-run", action="store_true", help="Build the calendar without writing a file"
-    )
-    parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
-    parser.add_argument(
-        "--output",
-        type=Path,
-        default=DEFAULT_OUTPUT_FILE,
-        help=f"Output iCal file path (default: {DEFAULT_OUTPUT_FILE})",
-    )
-    parser.add_argument(
-        "--holidays-file",
-        type=Path,
-        default=None,
-        help="Optional path to an alternate holidays.yaml file",
-    )
-    return parser
-
-
 def main() -> None:
-    if len(sys.argv) > 1 and sys.argv[1] in MUTATION_COMMANDS:
-        cli()
-        return
-
-    parser = build_parser()
-    args = parser.parse_args()
-    end_year = args.end_year if args.end_year is not None else calculate_default_end_year(args.year)
-    generate_calendar(
-        start_year=args.year,
-        end_year=end_year,
-        dry_run=args.dry_run,
-        verbose=args.verbose,
-        output_file=args.output,
-        holidays_file=args.holidays_file,
-    )
+    cli()
 
 
 __all__ = [
+    "BUNDLED_HOLIDAYS_FILE",
     "DEFAULT_OUTPUT_FILE",
     "DEFAULT_YEAR_COUNT",
+    "HolidayEntry",
     "add_holiday",
     "adjust_for_observance",
     "build_calendar",
@@ -452,8 +620,12 @@ __all__ = [
     "get_federal_holidays",
     "get_last_weekday",
     "get_nth_weekday",
+    "iter_calendar_lines",
+    "iter_holiday_entries",
     "load_holidays",
     "main",
     "remove_holiday",
+    "render_calendar",
     "validate_holiday_definitions",
+    "write_if_changed",
 ]
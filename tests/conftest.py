@@ -0,0 +1,14 @@
+import pytest
+from click.testing import CliRunner
+
+from generate_calendar import load_holidays
+
+
+@pytest.fixture(scope="session")
+def bundled_holidays() -> dict:
+    return load_holidays()
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    return CliRunner()
@@ -0,0 +1,77 @@
+import gzip
+import os
+from pathlib import Path
+
+import pytest
+from flask.testing import FlaskClient
+
+import app
+
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> FlaskClient:
+    output_path = tmp_path / "calendar.ics"
+    monkeypatch.setattr(app, "OUTPUT_FILE", output_path)
+    monkeypatch.setattr(app, "COMPRESSED_OUTPUT_FILE", tmp_path / "calendar.ics.gz")
+    return app.app.test_client()
+
+
+@pytest.fixture
+def built_client(client: FlaskClient) -> FlaskClient:
+    app.build_calendar_file()
+    return client
+
+
+def test_index_is_not_found_until_calendar_is_built(client: FlaskClient) -> None:
+    assert client.get("/").status_code == 404
+
+    app.build_calendar_file()
+
+    assert client.get("/").status_code == 200
+
+
+def test_index_serves_gzip_when_accepted(built_client: FlaskClient) -> None:
+    response = built_client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.vary
+    assert gzip.decompress(response.data) == app.OUTPUT_FILE.read_bytes()
+
+
+def test_index_serves_plain_calendar_without_gzip(built_client: FlaskClient) -> None:
+    response = built_client.get("/")
+
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+    assert "Accept-Encoding" in response.vary
+    assert response.data == app.OUTPUT_FILE.read_bytes()
+
+
+def test_index_uses_separate_etags_per_encoding(built_client: FlaskClient) -> None:
+    compressed = built_client.get("/", headers={"Accept-Encoding": "gzip"})
+    plain = built_client.get("/")
+
+    assert compressed.get_etag()[0] != plain.get_etag()[0]
+
+
+def test_index_ignores_stale_gzip(built_client: FlaskClient) -> None:
+    compressed_mtime_ns = app.COMPRESSED_OUTPUT_FILE.stat().st_mtime_ns
+    os.utime(app.OUTPUT_FILE, ns=(compressed_mtime_ns + 1, compressed_mtime_ns + 1))
+
+    response = built_client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.data == app.OUTPUT_FILE.read_bytes()
+
+
+@pytest.mark.parametrize("accept_encoding", ["gzip", "identity"])
+def test_index_returns_not_modified_for_matching_etag(
+    built_client: FlaskClient, accept_encoding: str
+) -> None:
+    headers = {"Accept-Encoding": accept_encoding}
+    etag = built_client.get("/", headers=headers).get_etag()[0]
+
+    response = built_client.get("/", headers={**headers, "If-None-Match": f'"{etag}"'})
+
+    assert response.status_code == 304
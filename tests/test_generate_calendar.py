@@ -1,22 +1,48 @@
-from datetime import date, datetime
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 import yaml
 from click.testing import CliRunner
+from icalendar import Calendar, Event
 
 from generate_calendar import (
+    DEFAULT_OUTPUT_FILE,
+    HolidayEntry,
+    adjust_for_observance,
+    build_calendar,
     build_holiday_entries,
     calculate_default_end_year,
     cli,
     generate_calendar,
     get_easter_sunday,
+    get_federal_holidays,
     get_last_weekday,
     get_nth_weekday,
     load_holidays,
+    render_calendar,
     validate_holiday_definitions,
+    write_if_changed,
 )
 
+EXPECTED_FEDERAL_2025 = {
+    "New Year's Day": date(2025, 1, 1),
+    "Martin Luther King Jr. Day": date(2025, 1, 20),
+    "Presidents' Day": date(2025, 2, 17),
+    "Memorial Day": date(2025, 5, 26),
+    "Juneteenth": date(2025, 6, 19),
+    "Independence Day": date(2025, 7, 4),
+    "Labor Day": date(2025, 9, 1),
+    "Columbus Day": date(2025, 10, 13),
+    "Veterans Day": date(2025, 11, 11),
+    "Thanksgiving Day": date(2025, 11, 27),
+    "Christmas Day": date(2025, 12, 25),
+}
+
 
 def write_holidays_file(path: Path, holidays: dict) -> None:
     path.write_text(
@@ -25,18 +51,86 @@ def write_holidays_file(path: Path, holidays: dict) -> None:
     )
 
 
-def test_easter_sunday() -> None:
-    assert get_easter_sunday(2025) == datetime(2025, 4, 20).date()
-    assert get_easter_sunday(2026) == datetime(2026, 4, 5).date()
+def holiday_config(*manual_holidays: dict) -> dict:
+    return {
+        "manual_holidays": list(manual_holidays),
+        "calculated_holidays": [],
+        "federal_holidays": [],
+    }
+
+
+@lru_cache(maxsize=None)
+def parsed_calendar(start_year: int, end_year: int) -> Calendar:
+    return Calendar.from_ical(render_calendar(start_year, end_year))
+
+
+@lru_cache(maxsize=None)
+def events_by_summary(year: int) -> dict[str, Event]:
+    return {str(event["SUMMARY"]): event for event in parsed_calendar(year, year).walk("VEVENT")}
+
+
+@pytest.mark.parametrize(
+    ("year", "expected"),
+    [
+        (2025, date(2025, 4, 20)),
+        (2026, date(2026, 4, 5)),
+        (1818, date(1818, 3, 22)),
+        (1943, date(1943, 4, 25)),
+        (2000, date(2000, 4, 23)),
+        (2038, date(2038, 4, 25)),
+        (2285, date(2285, 3, 22)),
+    ],
+)
+def test_easter_sunday(year: int, expected: date) -> None:
+    assert get_easter_sunday(year) == expected
+
+
+@pytest.mark.parametrize(
+    ("year", "month", "weekday", "nth", "expected"),
+    [
+        (2025, 1, 0, 3, EXPECTED_FEDERAL_2025["Martin Luther King Jr. Day"]),
+        (2025, 11, 3, 4, EXPECTED_FEDERAL_2025["Thanksgiving Day"]),
+        (2025, 9, 0, 1, date(2025, 9, 1)),
+        (2025, 2, 4, 4, date(2025, 2, 28)),
+        (2026, 11, 3, 4, date(2026, 11, 26)),
+    ],
+)
+def test_nth_weekday(year: int, month: int, weekday: int, nth: int, expected: date) -> None:
+    assert get_nth_weekday(year, month, weekday, nth) == expected
+
+
+@pytest.mark.parametrize(
+    ("year", "month", "weekday", "expected"),
+    [
+        (2025, 5, 0, EXPECTED_FEDERAL_2025["Memorial Day"]),
+        (2025, 12, 2, date(2025, 12, 31)),
+        (2025, 12, 0, date(2025, 12, 29)),
+        (2024, 2, 3, date(2024, 2, 29)),
+    ],
+)
+def test_last_weekday(year: int, month: int, weekday: int, expected: date) -> None:
+    assert get_last_weekday(year, month, weekday) == expected
+
 
+@pytest.mark.parametrize(
+    ("holiday_date", "expected"),
+    [
+        (date(2026, 7, 3), date(2026, 7, 3)),
+        (date(2026, 7, 4), date(2026, 7, 3)),
+        (date(2022, 12, 25), date(2022, 12, 26)),
+        (date(2022, 1, 1), date(2021, 12, 31)),
+    ],
+)
+def test_adjust_for_observance(holiday_date: date, expected: date) -> None:
+    assert adjust_for_observance(holiday_date) == expected
 
-def test_nth_weekday() -> None:
-    assert get_nth_weekday(2025, 1, 0, 3) == datetime(2025, 1, 20).date()
-    assert get_nth_weekday(2025, 11, 3, 4) == datetime(2025, 11, 27).date()
 
+def test_federal_holidays(bundled_holidays: dict) -> None:
+    federal_holidays = get_federal_holidays(2025, bundled_holidays["federal_holidays"])
 
-def test_last_weekday() -> None:
-    assert get_last_weekday(2025, 5, 0) == datetime(2025, 5, 26).date()
+    assert {
+        holiday["name"]: holiday["date"] for holiday in federal_holidays
+    } == EXPECTED_FEDERAL_2025
 
 
 def test_default_end_year_is_inclusive() -> None:
@@ -49,6 +143,26 @@ def test_load_holidays_uses_bundled_data() -> None:
     assert "National Ice Cream Day" in manual_names
 
 
+def test_load_holidays_reloads_file_after_it_changes(tmp_path: Path) -> None:
+    holiday_path = tmp_path / "holidays.yaml"
+    holiday_definitions = holiday_config({"name": "First Holiday", "month": 1, "day": 2})
+    write_holidays_file(holiday_path, holiday_definitions)
+
+    load_holidays(holiday_path)["manual_holidays"].clear()
+    assert load_holidays(holiday_path) == holiday_definitions
+
+    holiday_definitions["manual_holidays"].append({"name": "Second Holiday", "month": 3, "day": 4})
+    write_holidays_file(holiday_path, holiday_definitions)
+    assert load_holidays(holiday_path) == holiday_definitions
+
+
+def test_load_holidays_returns_independent_copies_of_bundled_config() -> None:
+    bundled_config = load_holidays()
+    bundled_config["federal_holidays"].clear()
+
+    assert load_holidays()["federal_holidays"]
+
+
 def test_validate_holiday_definitions_rejects_duplicate_names() -> None:
     with pytest.raises(ValueError, match="Holiday names must be unique"):
         validate_holiday_definitions(
@@ -71,6 +185,108 @@ def test_generate_calendar_writes_expected_output(tmp_path: Path) -> None:
     assert "SUMMARY:National Ice Cream Day" in calendar_text
 
 
+def test_generate_calendar_leaves_unchanged_output_untouched(tmp_path: Path) -> None:
+    output_path = tmp_path / "calendar.ics"
+    generate_calendar(2025, 2025, output_file=output_path)
+    os.utime(output_path, ns=(0, 0))
+
+    generate_calendar(2025, 2025, output_file=output_path)
+
+    assert output_path.stat().st_mtime_ns == 0
+    assert list(tmp_path.iterdir()) == [output_path]
+
+
+def test_write_if_changed_tolerates_concurrent_writers(tmp_path: Path) -> None:
+    output_path = tmp_path / "calendar.ics"
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(
+            executor.map(
+                lambda _: write_if_changed(output_path, [b"BEGIN:VCALENDAR\r\n"]), range(64)
+            )
+        )
+
+    assert output_path.read_bytes() == b"BEGIN:VCALENDAR\r\n"
+    assert list(tmp_path.iterdir()) == [output_path]
+
+
+def test_write_if_changed_applies_umask_to_new_files(tmp_path: Path) -> None:
+    output_path = tmp_path / "calendar.ics"
+    previous_umask = os.umask(0o077)
+    try:
+        write_if_changed(output_path, [b"BEGIN:VCALENDAR\r\n"])
+    finally:
+        os.umask(previous_umask)
+
+    assert output_path.stat().st_mode & 0o777 == 0o600
+
+
+def test_render_calendar_matches_icalendar_output() -> None:
+    assert render_calendar(2024, 2026) == build_calendar(2024, 2026).to_ical()
+
+
+@pytest.mark.parametrize(
+    ("holiday_name", "summary", "escape_on_fold"),
+    [
+        (
+            "Día de los Muertos; a holiday, with a name longer than one folded ICS line",
+            "Día de los Muertos; a holiday, with a name longer than one folded ICS line",
+            False,
+        ),
+        (
+            "Fête nationale — 日本の祝日 and 🎉 with enough multibyte text to fold several times over",
+            "Fête nationale — 日本の祝日 and 🎉 with enough multibyte text to fold several times over",
+            False,
+        ),
+        (
+            "Back\\slash, semi;colon and a carriage\rreturn padded past a single ICS content line",
+            "Back\\slash, semi;colon and a carriage\nreturn padded past a single ICS content line",
+            True,
+        ),
+    ],
+)
+def test_render_calendar_matches_icalendar_for_custom_names(
+    tmp_path: Path, holiday_name: str, summary: str, escape_on_fold: bool
+) -> None:
+    holiday_path = tmp_path / "holidays.yaml"
+    write_holidays_file(holiday_path, holiday_config({"name": holiday_name, "month": 11, "day": 2}))
+
+    calendar_bytes = render_calendar(2025, 2025, holidays_file=holiday_path)
+
+    assert all(len(line) <= 75 for line in calendar_bytes.split(b"\r\n"))
+    event = Calendar.from_ical(calendar_bytes).walk("VEVENT")[0]
+    assert str(event["SUMMARY"]) == summary
+    assert event["DTSTART"].dt == date(2025, 11, 2)
+    # icalendar 6 splits escapes across folds and 7 does not, so only compare bytes elsewhere.
+    if not escape_on_fold:
+        assert calendar_bytes == build_calendar(2025, 2025, holidays_file=holiday_path).to_ical()
+
+
+def test_rendered_calendar_includes_federal_holidays() -> None:
+    events = events_by_summary(2025)
+
+    for holiday_name, expected_date in EXPECTED_FEDERAL_2025.items():
+        assert events[holiday_name]["DTSTART"].dt == expected_date
+
+
+def test_rendered_calendar_uses_unique_uids() -> None:
+    uids = [str(event["UID"]) for event in parsed_calendar(2024, 2026).walk("VEVENT")]
+
+    assert len(uids) == len(set(uids))
+
+
+def test_generate_calendar_keeps_previous_output_when_generation_fails(tmp_path: Path) -> None:
+    output_path = tmp_path / "calendar.ics"
+    generate_calendar(2025, 2025, output_file=output_path)
+    calendar_bytes = output_path.read_bytes()
+
+    with pytest.raises(ValueError):
+        generate_calendar(2026, 2025, output_file=output_path)
+
+    assert output_path.read_bytes() == calendar_bytes
+    assert list(tmp_path.iterdir()) == [output_path]
+
+
 def test_generate_calendar_dry_run_does_not_write_file(tmp_path: Path) -> None:
     output_path = tmp_path / "calendar.ics"
 
@@ -80,6 +296,19 @@ def test_generate_calendar_dry_run_does_not_write_file(tmp_path: Path) -> None:
     assert not output_path.exists()
 
 
+def test_generate_calendar_verbose_logs_debug_records(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    holiday_path = tmp_path / "holidays.yaml"
+    write_holidays_file(holiday_path, holiday_config({"name": "Leap Day", "month": 2, "day": 29}))
+    caplog.set_level(logging.INFO)
+    caplog.handler.setLevel(logging.NOTSET)
+
+    generate_calendar(2025, 2025, dry_run=True, verbose=True, holidays_file=holiday_path)
+
+    assert any(record.levelno == logging.DEBUG for record in caplog.records)
+
+
 def test_build_holiday_entries_rejects_inverted_year_range() -> None:
     with pytest.raises(ValueError, match="end_year must be greater than or equal to start_year"):
         build_holiday_entries(2026, 2025)
@@ -104,32 +333,40 @@ def test_build_holiday_entries_keeps_actual_holiday_when_observed_date_differs(
 ) -> None:
     holidays = build_holiday_entries(start_year, end_year)
 
-    assert {"name": holiday_name, "date": actual_date} in holidays
-    assert {"name": f"{holiday_name} (Observed)", "date": observed_date} in holidays
-    assert {"name": holiday_name, "date": observed_date} not in holidays
+    assert HolidayEntry(holiday_name, actual_date) in holidays
+    assert HolidayEntry(f"{holiday_name} (Observed)", observed_date) in holidays
+    assert HolidayEntry(holiday_name, observed_date) not in holidays
+
+
+@pytest.mark.parametrize(
+    ("year", "holiday_name", "expected"),
+    [
+        (2026, "Independence Day", date(2026, 7, 4)),
+        (2026, "Independence Day (Observed)", date(2026, 7, 3)),
+        (2025, "Christmas Day", date(2025, 12, 25)),
+        (2022, "Christmas Day (Observed)", date(2022, 12, 26)),
+    ],
+)
+def test_rendered_calendar_places_observed_holidays(
+    year: int, holiday_name: str, expected: date
+) -> None:
+    assert events_by_summary(year)[holiday_name]["DTSTART"].dt == expected
 
 
 def test_build_holiday_entries_filters_observed_dates_by_actual_calendar_year() -> None:
     holidays = build_holiday_entries(2021, 2021)
 
-    assert {"name": "New Year's Day", "date": date(2021, 1, 1)} in holidays
-    assert {"name": "New Year's Day (Observed)", "date": date(2021, 12, 31)} in holidays
+    assert HolidayEntry("New Year's Day", date(2021, 1, 1)) in holidays
+    assert HolidayEntry("New Year's Day (Observed)", date(2021, 12, 31)) in holidays
 
 
 def test_build_holiday_entries_skips_february_29_on_non_leap_years(tmp_path: Path) -> None:
     holiday_path = tmp_path / "holidays.yaml"
-    write_holidays_file(
-        holiday_path,
-        {
-            "manual_holidays": [{"name": "Leap Day", "month": 2, "day": 29}],
-            "calculated_holidays": [],
-            "federal_holidays": [],
-        },
-    )
+    write_holidays_file(holiday_path, holiday_config({"name": "Leap Day", "month": 2, "day": 29}))
 
     holidays = build_holiday_entries(2024, 2025, holidays_file=holiday_path)
 
-    assert holidays == [{"name": "Leap Day", "date": date(2024, 2, 29)}]
+    assert holidays == [HolidayEntry("Leap Day", date(2024, 2, 29))]
 
 
 def test_build_holiday_entries_skips_disabled_holidays(tmp_path: Path) -> None:
@@ -165,7 +402,7 @@ def test_build_holiday_entries_skips_disabled_holidays(tmp_path: Path) -> None:
 
     holidays = build_holiday_entries(2025, 2025, holidays_file=holiday_path)
 
-    assert holidays == [{"name": "Enabled Manual Holiday", "date": date(2025, 8, 8)}]
+    assert holidays == [HolidayEntry("Enabled Manual Holiday", date(2025, 8, 8))]
 
 
 def test_validate_holiday_definitions_rejects_observed_non_fixed_federal_holiday() -> None:
@@ -190,19 +427,15 @@ def test_validate_holiday_definitions_rejects_observed_non_fixed_federal_holiday
 def test_validate_holiday_definitions_rejects_non_boolean_enabled_flag() -> None:
     with pytest.raises(ValueError, match="Holiday enabled flag must be true or false"):
         validate_holiday_definitions(
-            {
-                "manual_holidays": [{"name": "Bad Toggle", "month": 1, "day": 1, "enabled": "yes"}],
-                "calculated_holidays": [],
-                "federal_holidays": [],
-            }
+            holiday_config({"name": "Bad Toggle", "month": 1, "day": 1, "enabled": "yes"})
         )
 
 
-def test_add_holiday_updates_only_target_file(tmp_path: Path) -> None:
+def test_add_holiday_updates_only_target_file(
+    tmp_path: Path, bundled_holidays: dict, runner: CliRunner
+) -> None:
     holiday_path = tmp_path / "holidays.yaml"
-    holiday_config = load_holidays()
-    write_holidays_file(holiday_path, holiday_config)
-    runner = CliRunner()
+    write_holidays_file(holiday_path, bundled_holidays)
 
     result = runner.invoke(
         cli,
@@ -214,12 +447,83 @@ def test_add_holiday_updates_only_target_file(tmp_path: Path) -> None:
     assert any(holiday["name"] == "Test Holiday" for holiday in updated_holidays["manual_holidays"])
 
 
-def test_remove_holiday_updates_only_target_file(tmp_path: Path) -> None:
+def test_add_holiday_keeps_non_ascii_names_readable(tmp_path: Path, runner: CliRunner) -> None:
     holiday_path = tmp_path / "holidays.yaml"
-    holiday_config = load_holidays()
-    holiday_config["manual_holidays"].append({"name": "Temporary Holiday", "month": 8, "day": 8})
-    write_holidays_file(holiday_path, holiday_config)
-    runner = CliRunner()
+    write_holidays_file(holiday_path, holiday_config())
+
+    result = runner.invoke(
+        cli, ["add-holiday", "--holidays-file", str(holiday_path), "Día de los Muertos", "11", "2"]
+    )
+
+    assert result.exit_code == 0
+    assert "name: Día de los Muertos" in holiday_path.read_text(encoding="utf-8")
+    assert list(tmp_path.iterdir()) == [holiday_path]
+
+
+def test_add_holiday_rejects_invalid_date_without_touching_file(
+    tmp_path: Path, bundled_holidays: dict, runner: CliRunner
+) -> None:
+    holiday_path = tmp_path / "holidays.yaml"
+    write_holidays_file(holiday_path, bundled_holidays)
+    original_text = holiday_path.read_text(encoding="utf-8")
+
+    result = runner.invoke(
+        cli, ["add-holiday", "--holidays-file", str(holiday_path), "Bad Holiday", "2", "30"]
+    )
+
+    assert result.exit_code == 1
+    assert holiday_path.read_text(encoding="utf-8") == original_text
+
+
+def test_add_holiday_preserves_file_mode_and_symlink(tmp_path: Path, runner: CliRunner) -> None:
+    holiday_path = tmp_path / "holidays.yaml"
+    write_holidays_file(holiday_path, holiday_config())
+    holiday_path.chmod(0o640)
+    link_path = tmp_path / "linked.yaml"
+    link_path.symlink_to(holiday_path)
+
+    result = runner.invoke(
+        cli, ["add-holiday", "--holidays-file", str(link_path), "Test Holiday", "12", "1"]
+    )
+
+    assert result.exit_code == 0
+    assert link_path.is_symlink()
+    assert "Test Holiday" in holiday_path.read_text(encoding="utf-8")
+    assert holiday_path.stat().st_mode & 0o777 == 0o640
+
+
+def test_add_holiday_reports_unwritable_target(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: CliRunner
+) -> None:
+    holiday_path = tmp_path / "holidays.yaml"
+    write_holidays_file(holiday_path, holiday_config())
+    original_text = holiday_path.read_text(encoding="utf-8")
+
+    def deny_write(path: Path, chunks: object) -> bool:
+        raise PermissionError(13, "Permission denied", str(path))
+
+    monkeypatch.setattr("generate_calendar.write_if_changed", deny_write)
+
+    result = runner.invoke(
+        cli, ["add-holiday", "--holidays-file", str(holiday_path), "Test Holiday", "12", "1"]
+    )
+
+    assert result.exit_code == 1
+    assert holiday_path.read_text(encoding="utf-8") == original_text
+
+
+def test_remove_holiday_updates_only_target_file(
+    tmp_path: Path, bundled_holidays: dict, runner: CliRunner
+) -> None:
+    holiday_path = tmp_path / "holidays.yaml"
+    temporary_holiday = {"name": "Temporary Holiday", "month": 8, "day": 8}
+    write_holidays_file(
+        holiday_path,
+        {
+            **bundled_holidays,
+            "manual_holidays": [*bundled_holidays["manual_holidays"], temporary_holiday],
+        },
+    )
 
     result = runner.invoke(
         cli,
@@ -231,3 +535,53 @@ def test_remove_holiday_updates_only_target_file(tmp_path: Path) -> None:
     assert all(
         holiday["name"] != "Temporary Holiday" for holiday in updated_holidays["manual_holidays"]
     )
+
+
+def test_cli_generates_calendar_without_subcommand(tmp_path: Path, runner: CliRunner) -> None:
+    output_file = tmp_path / "holidays.ics"
+
+    result = runner.invoke(
+        cli, ["--year", "2025", "--end-year", "2025", "--output", str(output_file)]
+    )
+
+    assert result.exit_code == 0
+    assert output_file.read_bytes() == render_calendar(2025, 2025)
+
+
+def test_cli_writes_default_output_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: CliRunner
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(cli, ["--year", "2025", "--end-year", "2025"])
+
+    assert result.exit_code == 0
+    assert (tmp_path / DEFAULT_OUTPUT_FILE).read_bytes() == render_calendar(2025, 2025)
+
+
+def test_cli_rejects_generation_options_before_subcommand(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, bundled_holidays: dict, runner: CliRunner
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    holiday_path = tmp_path / "holidays.yaml"
+    write_holidays_file(holiday_path, bundled_holidays)
+    original_text = holiday_path.read_text(encoding="utf-8")
+
+    result = runner.invoke(
+        cli, ["--holidays-file", str(holiday_path), "add-holiday", "Test Holiday", "12", "1"]
+    )
+
+    assert result.exit_code == 2
+    assert holiday_path.read_text(encoding="utf-8") == original_text
+    assert not (tmp_path / DEFAULT_OUTPUT_FILE).exists()
+
+
+def test_cli_rejects_inverted_year_range(tmp_path: Path, runner: CliRunner) -> None:
+    output_file = tmp_path / "holidays.ics"
+
+    result = runner.invoke(
+        cli, ["--year", "2026", "--end-year", "2025", "--output", str(output_file)]
+    )
+
+    assert result.exit_code == 2
+    assert not output_file.exists()